@@ -5,7 +5,7 @@ This module exposes base classes and utilities for digital I/O, timers,
 counters, switches, and the main PLC execution engine.
 """
 
-from pyberryplc.core.plc import AbstractPLC, MemoryVariable
+from pyberryplc.core.plc import AbstractPLC, MemoryVariable, BitMemoryVariable, AnalogMemoryVariable
 from pyberryplc.core.gpio import DigitalInput, DigitalOutput, PWMOutput
 from pyberryplc.core.timers import TimerSingleScan, TimerOnDelay, TimerOffDelay
 from pyberryplc.core.counters import CounterUp, CounterDown, CounterUpDown
@@ -15,6 +15,8 @@ from pyberryplc.core.exceptions import InternalCommunicationError, Configuration
 __all__ = [
     "AbstractPLC",
     "MemoryVariable",
+    "BitMemoryVariable",
+    "AnalogMemoryVariable",
     "DigitalInput",
     "DigitalOutput",
     "PWMOutput",
@@ -3,6 +3,17 @@ from gpiozero.pins.pigpio import PiGPIOFactory, PiFactory
 from gpiozero import DigitalInputDevice, DigitalOutputDevice, PWMOutputDevice
 
 
+def _bcm_number(device) -> int:
+    """Returns the BCM number of the GPIO pin a `gpiozero` device is connected 
+    to.
+    """
+    info = getattr(device.pin, 'info', None)
+    if info is not None:
+        # gpiozero >= 2.0: the pin name has the form 'GPIO<n>'.
+        return int(info.name[4:])
+    return device.pin.number
+
+
 class GPIO(ABC):
     def_pin_factory = PiGPIOFactory()
     
@@ -19,6 +30,14 @@ class GPIO(ABC):
         else:
             self.pin_factory = pin_factory
     
+    @property
+    def bank_mask(self) -> int:
+        """Returns the bit of the GPIO pin in GPIO bank 1 (GPIO 0-31) of 
+        `pigpio`. Only to be used with a pigpio-based pin factory, whose pins
+        are named 'GPIO<n>'.
+        """
+        return 1 << _bcm_number(self._device)
+    
     @abstractmethod
     def read(self) -> bool | int | float:
         pass
@@ -81,6 +100,9 @@ class DigitalInput(GPIO):
             bounce_time=0,
             pin_factory=self.pin_factory
         )
+        # Logic of the pin, needed when the input is read through a single read
+        # of the whole GPIO bank (see `bank_mask`).
+        self.inverted = pull_up or (pull_up is None and not active_state)
     
     def read(self) -> bool:
         return self._device.value
@@ -131,6 +153,9 @@ class DigitalOutput(GPIO):
             initial_value=initial_value,
             pin_factory=self.pin_factory
         )
+        # Logic of the pin, needed when the output is written to and read from
+        # the whole GPIO bank at once (see `bank_mask`).
+        self.inverted = not active_high
     
     def read(self) -> bool | int:
         return self._device.value
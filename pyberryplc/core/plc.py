@@ -2,14 +2,24 @@ from abc import ABC, abstractmethod
 import sys
 import signal
 import logging
-from dataclasses import dataclass
+from types import MethodType
+from typing import Callable
+from dataclasses import dataclass, field
 from gpiozero.pins.pigpio import PiFactory
 from pyberryplc.utils import EmailNotification
 from .gpio import GPIO, DigitalInput, DigitalOutput, PWMOutput
 from .exceptions import ConfigurationError, InternalCommunicationError, EmergencyException
 
+# Number of PLC scan cycles kept in the history of the packed digital input 
+# states (must be a power of 2).
+_INPUT_HISTORY_LEN = 8
 
-@dataclass
+# Number of memory variables preallocated in the memory variable pool of the 
+# PLC, which is also the maximum size of the pool.
+_MEMVAR_POOL_SIZE = 64
+
+
+@dataclass(slots=True)
 class MemoryVariable:
     """
     Represents a variable with a memory: the variable holds its current state,
@@ -28,8 +38,10 @@ class MemoryVariable:
         Indicates that the memory variable should be treated as a single bit 
         variable (its value can be either 0 or 1). Default value is `True`.
     decimal_precision: int
-        Sets the decimal precision for floating point values in case the memory
-        variable state is represented by a float. The default precision is 3.
+        Sets the decimal precision to which the state of the memory variable is
+        rounded when it is returned by `state`. Rounding only applies when 
+        `single_bit` is `False`; the state of a single bit memory variable is 
+        returned as is. The default precision is 3.
     """
     curr_state: bool | int | float = 0
     prev_state: bool | int | float = 0
@@ -41,8 +53,7 @@ class MemoryVariable:
         Before `value` is assigned to the current state of the variable, the
         preceding current state is stored in attribute `prev_state`.
         """
-        self.prev_state = self.curr_state
-        self.curr_state = value
+        self.prev_state, self.curr_state = self.curr_state, value
     
     @property
     def active(self) -> bool:
@@ -102,14 +113,89 @@ class MemoryVariable:
     @property
     def state(self) -> bool | int | float:
         """Returns the current state (value) of the memory variable, i.e. the 
-        state (value) in the current PLC scan cycle. If the state is represented
-        by a float, it will be rounded to the decimal precision specified when
-        the memory variable was instantiated.
+        state (value) in the current PLC scan cycle. If the memory variable is
+        not single bit, the state will be rounded to the decimal precision 
+        specified when the memory variable was instantiated.
         """
-        if isinstance(self.curr_state, float):
-            return round(self.curr_state, self.decimal_precision)
-        else:
+        if self.single_bit:
             return self.curr_state
+        return round(self.curr_state, self.decimal_precision)
+
+
+@dataclass(slots=True)
+class BitMemoryVariable(MemoryVariable):
+    """
+    Memory variable that is always treated as a single bit variable. Its methods
+    do not need to check attribute `single_bit` each time they are called. 
+    Used for the digital inputs/outputs and the markers of the PLC. The state
+    of the variable is always stored as an integer 0 or 1.
+    """
+    single_bit: bool = field(default=True, init=False)
+
+    def __post_init__(self) -> None:
+        self.curr_state = 1 if self.curr_state else 0
+        self.prev_state = 1 if self.prev_state else 0
+
+    def update(self, value: bool | int | float) -> None:
+        """Updates the current state of the variable with 1 if `value` 
+        evaluates to `True`, else with 0. Before, the preceding current state is
+        stored in attribute `prev_state`.
+        """
+        self.prev_state, self.curr_state = self.curr_state, 1 if value else 0
+
+    def activate(self) -> None:
+        """Sets the current state to `True` (1)."""
+        self.prev_state, self.curr_state = self.curr_state, 1
+
+    def deactivate(self) -> None:
+        """Sets the current state to `False` (0)."""
+        self.prev_state, self.curr_state = self.curr_state, 0
+
+    @property
+    def rising_edge(self) -> bool:
+        """Returns `True` if `prev_state` is 0 and `curr_state` is 1."""
+        return self.curr_state > self.prev_state
+
+    @property
+    def falling_edge(self) -> bool:
+        """Returns `True` if `prev_state` is 1 and `curr_state` is 0."""
+        return self.curr_state < self.prev_state
+
+    @property
+    def state(self) -> int:
+        """Returns the current state of the memory variable."""
+        return self.curr_state
+
+
+@dataclass(slots=True)
+class AnalogMemoryVariable(MemoryVariable):
+    """
+    Memory variable that holds an analog value (e.g. the value of a PWM output). 
+    It cannot be activated or deactivated and has no edges: these methods 
+    immediately raise a `ValueError` exception.
+    """
+    single_bit: bool = field(default=False, init=False)
+
+    def activate(self) -> None:
+        raise ValueError("Memory variable is not single bit.")
+
+    def deactivate(self) -> None:
+        raise ValueError("Memory variable is not single bit.")
+
+    @property
+    def rising_edge(self) -> bool:
+        raise ValueError("Memory variable is not single bit.")
+
+    @property
+    def falling_edge(self) -> bool:
+        raise ValueError("Memory variable is not single bit.")
+
+    @property
+    def state(self) -> int | float:
+        """Returns the current state of the memory variable, rounded to its
+        decimal precision.
+        """
+        return round(self.curr_state, self.decimal_precision)
 
 
 class AbstractPLC(ABC):
@@ -121,6 +207,21 @@ class AbstractPLC(ABC):
     derived from this base class and implementing the abstract methods of this 
     base class.
     """
+    # The attributes of the PLC are stored in slots. `__dict__` is included, 
+    # so that also derived PLC classes which declare `__slots__` themselves 
+    # still have an instance dictionary: `finalize` needs it to bind its 
+    # generated methods to the PLC object.
+    __slots__ = (
+        'pin_factory', 'eml_notification', 'logger',
+        '_inputs', '_outputs', 'input_registry', 'output_registry', 
+        'marker_registry', '_output_memvars', '_marker_list', '_pi', 
+        '_bank_inputs', '_device_inputs', '_bank_outputs', '_bank_output_mask', 
+        '_device_outputs', 
+        '_memvar_pool', '_pooled_ids', '_input_masks', 'input_bits', 'prev_input_bits', 
+        'rising_edges', 'falling_edges', 'scan_cycle', '_input_history', 
+        '_exit', '__dict__'
+    )
+
     def __init__(
         self,
         pin_factory: PiFactory | None = None,
@@ -168,9 +269,49 @@ class AbstractPLC(ABC):
         self.output_registry: dict[str, MemoryVariable] = {}
         self.marker_registry: dict[str, MemoryVariable] = {}
         
+        # List of the output memory variables, so that the PLC scan cycle can
+        # iterate over them without dictionary lookups.
+        self._output_memvars: list[MemoryVariable] = []
+        
+        # If the pin factory is pigpio-based, the digital inputs/outputs are
+        # read and written all at once through GPIO bank 1 (GPIO 0-31), so that
+        # a PLC scan cycle needs only one round-trip to the pigpio daemon for 
+        # reading and one for writing them. PWM outputs, and digital 
+        # inputs/outputs on pins outside bank 1, are accessed through their own
+        # `GPIO` object (bound `read`/`write` methods). Each input entry also 
+        # holds the bit mask of the input in `input_bits`.
+        self._pi = getattr(pin_factory or GPIO.def_pin_factory, 'connection', None)
+        self._bank_inputs: list[tuple[MemoryVariable, int, int, int]] = []
+        self._device_inputs: list[tuple[Callable, MemoryVariable, int]] = []
+        self._bank_outputs: list[tuple[MemoryVariable, MemoryVariable, int, int]] = []
+        self._bank_output_mask: int = 0
+        self._device_outputs: list[tuple[Callable, Callable, MemoryVariable, MemoryVariable]] = []
+        self._marker_list: list[MemoryVariable] = []
+        
+        # Pool of preallocated memory variables that can be borrowed for 
+        # transient use within the control routine (see `borrow_memvar`).
+        self._memvar_pool: list[MemoryVariable] = [MemoryVariable() for _ in range(_MEMVAR_POOL_SIZE)]
+        self._pooled_ids: set[int] = {id(memvar) for memvar in self._memvar_pool}
+        
+        # The current and previous states of the digital inputs are also 
+        # packed into integers: each digital input gets its own bit in the 
+        # order the inputs were added. The rising and falling edges of all
+        # digital inputs are determined at once in each PLC scan cycle (see 
+        # `read_inputs`).
+        self._input_masks: dict[str, int] = {}
+        self.input_bits: int = 0
+        self.prev_input_bits: int = 0
+        self.rising_edges: int = 0
+        self.falling_edges: int = 0
+        
+        # Ring buffer with the packed digital input states of the last PLC scan
+        # cycles, indexed by the scan cycle counter (see `past_input_bits`).
+        self.scan_cycle: int = 0
+        self._input_history: list[int] = [0] * _INPUT_HISTORY_LEN
+        
         # To terminate program: press Ctrl-Z and method `exit_handler` will be
         # called which terminates the PLC scanning loop.
-        signal.signal(signal.SIGTSTP, lambda signum, frame: self.exit_handler())
+        signal.signal(signal.SIGTSTP, self._sigtstp)
         self._exit: bool = False
 
     def add_digital_input(
@@ -209,10 +350,27 @@ class AbstractPLC(ABC):
             pull_up=None, 
             active_state=active_state
         )
-        self.input_registry[label] = MemoryVariable(
+        self.input_registry[label] = BitMemoryVariable(
             curr_state=init_value,
             prev_state=init_value
         )
+        mask = 1 << len(self._input_masks)
+        self._input_masks[label] = mask
+        if init_value:
+            self.input_bits |= mask
+            self.prev_input_bits |= mask
+            self._input_history = [bits | mask for bits in self._input_history]
+        di = self._inputs[label]
+        pin_mask = self._bank_pin_mask(di)
+        if pin_mask:
+            self._bank_inputs.append((
+                self.input_registry[label],
+                mask,
+                pin_mask,
+                0 if di.inverted else pin_mask
+            ))
+        else:
+            self._device_inputs.append((di.read, self.input_registry[label], mask))
         return self.input_registry[label]
 
     def add_digital_output(
@@ -244,22 +402,34 @@ class AbstractPLC(ABC):
         The memory variable of the digital output in the output memory registry, 
         and the memory variable of its status in the input memory registry. 
         """
-        self._outputs[label] = DigitalOutput(
+        do = DigitalOutput(
             pin, 
             label,
             active_high,
             self.pin_factory,
             init_value
         )
-        self.output_registry[label] = MemoryVariable(
+        memvar = BitMemoryVariable(
             curr_state=init_value,
             prev_state=init_value
         )
-        self.input_registry[f"{label}_status"] = MemoryVariable()
-        return (
-            self.output_registry[label], 
-            self.input_registry[f"{label}_status"]
-        )
+        status = BitMemoryVariable()
+        self._outputs[label] = do
+        self.output_registry[label] = memvar
+        self.input_registry[f"{label}_status"] = status
+        self._output_memvars.append(memvar)
+        pin_mask = self._bank_pin_mask(do)
+        if pin_mask:
+            self._bank_outputs.append((
+                memvar,
+                status,
+                pin_mask,
+                0 if do.inverted else pin_mask
+            ))
+            self._bank_output_mask |= pin_mask
+        else:
+            self._device_outputs.append((do.read, do.write, memvar, status))
+        return memvar, status
     
     def add_pwm_output(
         self,
@@ -307,35 +477,121 @@ class AbstractPLC(ABC):
         The memory variable of the PWM output in the output memory registry, 
         and the memory variable of its status in the input memory registry.
         """
-        self._outputs[label] = PWMOutput(
+        pwm_output = PWMOutput(
             pin, label, self.pin_factory, init_value, frame_width, 
             min_pulse_width, max_pulse_width, min_value, max_value
         )
-        self.output_registry[label] = MemoryVariable(
+        memvar = AnalogMemoryVariable(
             curr_state=init_value,
-            prev_state=init_value,
-            single_bit=False
-        )
-        self.input_registry[f"{label}_status"] = MemoryVariable(
-            single_bit=False,
-            decimal_precision=decimal_precision
-        )
-        return (
-            self.output_registry[label],
-            self.input_registry[f"{label}_status"]
+            prev_state=init_value
         )
+        status = AnalogMemoryVariable(decimal_precision=decimal_precision)
+        self._outputs[label] = pwm_output
+        self.output_registry[label] = memvar
+        self.input_registry[f"{label}_status"] = status
+        self._output_memvars.append(memvar)
+        self._device_outputs.append((
+            pwm_output.read, pwm_output.write, memvar, status
+        ))
+        return memvar, status
     
     def add_marker(self, label: str, init_value: bool | int = 0) -> MemoryVariable:
         """Adds a marker to the marker-registry of the PLC-application and 
         returns its `MemoryVariable` object.
         """
-        marker = MemoryVariable(
+        marker = BitMemoryVariable(
             curr_state=init_value,
             prev_state=init_value
         )
         self.marker_registry[label] = marker
+        self._marker_list.append(marker)
         return marker
 
+    def _bank_pin_mask(self, gpio: GPIO) -> int:
+        """Returns the bit mask of the pin of `gpio` in GPIO bank 1, or 0 if the
+        pin must be accessed through its own `GPIO` object, i.e. if the pin 
+        factory is not pigpio-based or if the pin is outside bank 1 (BCM 32 
+        and higher, e.g. on a Compute Module).
+        """
+        if self._pi is None:
+            return 0
+        pin_mask = gpio.bank_mask
+        if pin_mask >> 32:
+            return 0
+        return pin_mask
+
+    def borrow_memvar(self) -> MemoryVariable:
+        """Returns a `MemoryVariable` object from the memory variable pool of
+        the PLC. If the pool is empty, a new `MemoryVariable` object is created.
+        
+        Intended for transient helpers (e.g. edge latches) that are needed 
+        within a single execution of `control_routine`, so that no new memory 
+        variables must be allocated in every PLC scan cycle. Return the memory 
+        variable to the pool with `return_memvar` when it is no longer needed.
+        """
+        try:
+            memvar = self._memvar_pool.pop()
+        except IndexError:
+            return MemoryVariable()
+        self._pooled_ids.discard(id(memvar))
+        return memvar
+
+    def return_memvar(self, memvar: MemoryVariable) -> None:
+        """Resets the given memory variable, which was borrowed with 
+        `borrow_memvar`, to its default state and puts it back into the memory
+        variable pool of the PLC. If the pool is already full, the memory 
+        variable is not put back, so that the pool never grows beyond its 
+        preallocated size.
+        
+        Raises a `ValueError` exception if `memvar` is not a plain 
+        `MemoryVariable` object (e.g. a `BitMemoryVariable` or 
+        `AnalogMemoryVariable` from the registries of the PLC), or if it is
+        currently in the pool.
+        """
+        if type(memvar) is not MemoryVariable:
+            raise ValueError("Only `MemoryVariable` objects can be returned to the pool.")
+        if id(memvar) in self._pooled_ids:
+            raise ValueError("Memory variable has already been returned to the pool.")
+        memvar.curr_state = 0
+        memvar.prev_state = 0
+        memvar.single_bit = True
+        memvar.decimal_precision = 3
+        if len(self._memvar_pool) < _MEMVAR_POOL_SIZE:
+            self._memvar_pool.append(memvar)
+            self._pooled_ids.add(id(memvar))
+
+    def input_mask(self, label: str) -> int:
+        """Returns the bit mask of the digital input with the given label. The
+        bit mask can be used to test the digital input in the packed attributes
+        `input_bits`, `prev_input_bits`, `rising_edges`, and `falling_edges` of
+        the PLC, e.g.
+        `if self.rising_edges & start_mask: ...`.
+
+        Raises a `ConfigurationError` exception if the digital input with the
+        given label has not been added to the PLC-application before.
+        """
+        try:
+            return self._input_masks[label]
+        except KeyError:
+            raise ConfigurationError(f"unknown digital input `{label}`") from None
+
+    def past_input_bits(self, n: int) -> int:
+        """Returns the packed states of the digital inputs `n` PLC scan cycles
+        ago (`n` = 0 returns the states of the current scan cycle). At most
+        7 scan cycles can be looked back. 
+        
+        This can be used e.g. to debounce inputs: the inputs that have been
+        high during the last three scan cycles are given by
+        `self.past_input_bits(0) & self.past_input_bits(1) & self.past_input_bits(2)`.
+        
+        Raises a `ValueError` exception if `n` is out of range.
+        """
+        if not 0 <= n < _INPUT_HISTORY_LEN:
+            raise ValueError(
+                f"`n` must be between 0 and {_INPUT_HISTORY_LEN - 1}"
+            )
+        return self._input_history[(self.scan_cycle - n) & (_INPUT_HISTORY_LEN - 1)]
+
     def di_read(self, label: str) -> bool:
         """Reads the current state of the digital input specified by the given
         label.
@@ -346,12 +602,11 @@ class AbstractPLC(ABC):
         Returns the read value (integer). If the digital input has been
         configured as normally closed, the inverted value is returned.
         """
-        di = self._inputs.get(label)
-        if di:
-            value = di.read()
-            return value
-        else:
-            raise ConfigurationError(f"unknown digital input `{label}`")
+        try:
+            di = self._inputs[label]
+        except KeyError:
+            raise ConfigurationError(f"unknown digital input `{label}`") from None
+        return di.read()
 
     def do_write(self, label: str, value: bool) -> None:
         """Writes the given value (bool) to the digital output with the given
@@ -360,11 +615,11 @@ class AbstractPLC(ABC):
         Raises a `ConfigurationError` exception if the digital output with the
         given label has not been added to the PLC-application before.
         """
-        do = self._outputs.get(label)
-        if do:
-            do.write(value)
-        else:
-            raise ConfigurationError(f"unknown digital output `{label}`")
+        try:
+            do = self._outputs[label]
+        except KeyError:
+            raise ConfigurationError(f"unknown digital output `{label}`") from None
+        do.write(value)
     
     def pwm_write(self, label: str, value: float) -> None:
         """Writes the given value (float) to the PWM output with the given 
@@ -373,26 +628,47 @@ class AbstractPLC(ABC):
         Raises a `ConfigurationError` exception if the PWM output with the
         given label has not been added to the PLC-application before.
         """
-        pwm_output = self._outputs.get(label)
-        if pwm_output:
-            pwm_output.write(value)
-        else:
-            raise ConfigurationError(f"unknown PWM output `{label}`")
+        try:
+            pwm_output = self._outputs[label]
+        except KeyError:
+            raise ConfigurationError(f"unknown PWM output `{label}`") from None
+        pwm_output.write(value)
     
     def read_inputs(self) -> None:
         """Reads all the physical inputs defined in the PLC application 
         and writes their current states in their respective input registries.
+        The packed states of the digital inputs and their rising and falling
+        edges are also updated (attributes `input_bits`, `prev_input_bits`, 
+        `rising_edges`, and `falling_edges`).
 
         Raises an `InternalCommunicationError` exception when a read operation
         fails.
         """
-        try:
-            for input_ in self._inputs.values():
-                self.input_registry[input_.label].update(input_.read())
-            for output in self._outputs.values():
-                self.input_registry[f"{output.label}_status"].update(output.read())
-        except InternalCommunicationError as error:
-            self.int_com_error_handler(error)
+        prev_bits = self.input_bits
+        curr_bits = 0
+        if self._bank_inputs or self._bank_outputs:
+            bank = self._pi.read_bank_1()
+            for memvar, mask, pin_mask, active in self._bank_inputs:
+                if (bank & pin_mask) == active:
+                    memvar.update(1)
+                    curr_bits |= mask
+                else:
+                    memvar.update(0)
+            for _, status, pin_mask, active in self._bank_outputs:
+                status.update(1 if (bank & pin_mask) == active else 0)
+        for read, memvar, mask in self._device_inputs:
+            value = read()
+            memvar.update(value)
+            if value:
+                curr_bits |= mask
+        self.prev_input_bits = prev_bits
+        self.input_bits = curr_bits
+        self.rising_edges = curr_bits & ~prev_bits
+        self.falling_edges = prev_bits & ~curr_bits
+        self.scan_cycle += 1
+        self._input_history[self.scan_cycle & (_INPUT_HISTORY_LEN - 1)] = curr_bits
+        for read, _, _, status in self._device_outputs:
+            status.update(read())
 
     def write_outputs(self) -> None:
         """Writes all the current states in the output registries to their 
@@ -401,18 +677,128 @@ class AbstractPLC(ABC):
         Raises an `InternalCommunicationError` exception when a write operation
         fails.
         """
-        try:
-            for output in self._outputs.values():
-                output.write(self.output_registry[output.label].curr_state)
-        except InternalCommunicationError as error:
-            self.int_com_error_handler(error)
+        if self._bank_outputs:
+            levels = 0
+            for memvar, _, pin_mask, active in self._bank_outputs:
+                levels |= active if memvar.curr_state else pin_mask ^ active
+            clear_mask = self._bank_output_mask & ~levels
+            if levels:
+                self._pi.set_bank_1(levels)
+            if clear_mask:
+                self._pi.clear_bank_1(clear_mask)
+        for _, write, memvar, _ in self._device_outputs:
+            write(memvar.curr_state)
     
     def update_registries(self):
-        for marker in self.marker_registry.values():
+        for marker in self._marker_list:
             marker.update(marker.curr_state)
-        for output in self.output_registry.values():
-            output.update(output.curr_state)
+        for memvar in self._output_memvars:
+            memvar.update(memvar.curr_state)
     
+    def finalize(self) -> None:
+        """Replaces the methods `read_inputs`, `write_outputs`, and 
+        `update_registries` of the PLC object by versions that are generated
+        for the inputs, outputs, and markers which have been added to the PLC 
+        application: the loops over the inputs, outputs, and markers are 
+        unrolled into straight-line code.
+        
+        Call this method once, after all inputs, outputs, and markers have
+        been added and before method `run` is called. Inputs, outputs, and 
+        markers added afterward are not handled by the generated methods. 
+        Methods that have been overridden in the derived PLC class are not 
+        replaced.
+        """
+        namespace = {}
+        if self._pi is not None:
+            namespace["_read_bank"] = self._pi.read_bank_1
+            namespace["_set_bank"] = self._pi.set_bank_1
+            namespace["_clear_bank"] = self._pi.clear_bank_1
+
+        # read_inputs
+        lines = [
+            "def read_inputs(self):",
+            "    prev_bits = self.input_bits",
+            "    curr_bits = 0"
+        ]
+        if self._bank_inputs or self._bank_outputs:
+            lines.append("    bank = _read_bank()")
+        for i, (memvar, mask, pin_mask, active) in enumerate(self._bank_inputs):
+            namespace[f"_bi{i}"] = memvar
+            lines += [
+                f"    if (bank & {pin_mask}) == {active}:",
+                f"        _bi{i}.update(1)",
+                f"        curr_bits |= {mask}",
+                f"    else:",
+                f"        _bi{i}.update(0)"
+            ]
+        for i, (_, status, pin_mask, active) in enumerate(self._bank_outputs):
+            namespace[f"_bs{i}"] = status
+            lines.append(f"    _bs{i}.update(1 if (bank & {pin_mask}) == {active} else 0)")
+        for i, (read, memvar, mask) in enumerate(self._device_inputs):
+            namespace[f"_di{i}"] = memvar
+            namespace[f"_di{i}_read"] = read
+            lines += [
+                f"    value = _di{i}_read()",
+                f"    _di{i}.update(value)",
+                f"    if value:",
+                f"        curr_bits |= {mask}"
+            ]
+        for i, (read, _, _, status) in enumerate(self._device_outputs):
+            namespace[f"_ds{i}"] = status
+            namespace[f"_ds{i}_read"] = read
+            lines.append(f"    _ds{i}.update(_ds{i}_read())")
+        lines += [
+            "    self.prev_input_bits = prev_bits",
+            "    self.input_bits = curr_bits",
+            "    self.rising_edges = curr_bits & ~prev_bits",
+            "    self.falling_edges = prev_bits & ~curr_bits",
+            "    self.scan_cycle += 1",
+            f"    self._input_history[self.scan_cycle & {_INPUT_HISTORY_LEN - 1}] = curr_bits",
+            ""
+        ]
+
+        # write_outputs
+        lines += [
+            "def write_outputs(self):"
+        ]
+        if self._bank_outputs:
+            terms = []
+            for i, (memvar, _, pin_mask, active) in enumerate(self._bank_outputs):
+                namespace[f"_bo{i}"] = memvar
+                terms.append(f"({active} if _bo{i}.curr_state else {pin_mask ^ active})")
+            lines += [
+                f"    levels = {' | '.join(terms)}",
+                f"    clear_mask = {self._bank_output_mask} & ~levels",
+                f"    if levels:",
+                f"        _set_bank(levels)",
+                f"    if clear_mask:",
+                f"        _clear_bank(clear_mask)"
+            ]
+        for i, (_, write, memvar, _) in enumerate(self._device_outputs):
+            namespace[f"_do{i}"] = memvar
+            namespace[f"_do{i}_write"] = write
+            lines.append(f"    _do{i}_write(_do{i}.curr_state)")
+        if lines[-1] == "def write_outputs(self):":
+            lines.append("    pass")
+        lines.append("")
+
+        # update_registries
+        lines.append("def update_registries(self):")
+        for i, marker in enumerate(self._marker_list):
+            namespace[f"_m{i}"] = marker
+            lines.append(f"    _m{i}.update(_m{i}.curr_state)")
+        for i, memvar in enumerate(self._output_memvars):
+            namespace[f"_o{i}"] = memvar
+            lines.append(f"    _o{i}.update(_o{i}.curr_state)")
+        if lines[-1] == "def update_registries(self):":
+            lines.append("    pass")
+
+        source = "\n".join(lines) + "\n"
+        exec(compile(source, f"<{type(self).__name__}.finalize>", "exec"), namespace)
+        for name in ("read_inputs", "write_outputs", "update_registries"):
+            if getattr(type(self), name) is getattr(AbstractPLC, name):
+                setattr(self, name, MethodType(namespace[name], self))
+
     def int_com_error_handler(self, error: InternalCommunicationError):
         """Handles an `InternalCommunication` exception. An error message is
         sent to the logger. If the email notification service is used, an email
@@ -424,6 +810,10 @@ class AbstractPLC(ABC):
         if self.eml_notification: self.eml_notification.send(msg)
         sys.exit(msg)
 
+    def _sigtstp(self, signum, frame):
+        """Handler of signal SIGTSTP (<Ctrl-Z>): calls `exit_handler`."""
+        self.exit_handler()
+
     def exit_handler(self):
         """Terminates the PLC scanning loop when the user has pressed the key
         combination <Ctrl-Z> on the keyboard of the PLC (Raspberry Pi) to stop
@@ -462,19 +852,32 @@ class AbstractPLC(ABC):
 
     def run(self):
         """Implements the global running operation of the PLC."""
-        while not self._exit:
-            try:
-                self.update_registries()
-                self.read_inputs()
-                self.control_routine()
-            except EmergencyException:
-                self.emergency_routine()
-                return
-            finally:
-                self.write_outputs()
-        else:
-            # Executed when the while condition has become `False`, but not when
-            # the while loop has been interrupted by the `return` statement in
-            # the `EmergencyException` clause
+        # The methods called in the PLC scan loop are bound to local names 
+        # once, so they need not be looked up on `self` in every scan cycle.
+        update_registries = self.update_registries
+        read_inputs = self.read_inputs
+        control_routine = self.control_routine
+        write_outputs = self.write_outputs
+        try:
+            # The exit flag is only tested at the end of a scan cycle, so that 
+            # the body of the scan loop runs straight through.
+            while True:
+                try:
+                    update_registries()
+                    read_inputs()
+                    control_routine()
+                except EmergencyException:
+                    self.emergency_routine()
+                    return
+                finally:
+                    write_outputs()
+                if self._exit:
+                    break
+            # Reached when the scan loop has been stopped by the exit handler, 
+            # but not when it has been interrupted by the `return` statement in
+            # the `EmergencyException` clause.
             self.exit_routine()
             self.write_outputs()
+        except InternalCommunicationError as error:
+            # A failing read or write operation terminates the PLC application.
+            self.int_com_error_handler(error)
@@ -1,4 +1,4 @@
-from .plc import MemoryVariable
+from .plc import MemoryVariable, BitMemoryVariable
 
 
 class ToggleSwitch:
@@ -22,7 +22,7 @@ class ToggleSwitch:
             cycle.
         """
         self._button = button
-        self._switch = MemoryVariable(curr_state=0, prev_state=0)
+        self._switch = BitMemoryVariable(curr_state=0, prev_state=0)
     
     def update(self) -> None:
         """Updates the state of the switch.  